@@ -0,0 +1,111 @@
+"""
+Import Time Check
+
+This script checks that the entry points and the `simple` package start up quickly.
+Each module is imported in a fresh interpreter with `python -X importtime`, and the
+check fails if its cumulative import time goes over the budget or if it loads a heavy
+dependency that should only be imported by the stage that uses it.
+
+Usage:
+    python check_import_time.py [budget_ms]
+"""
+
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+# Modules that must stay cheap to import
+MODULES = [
+    "main_simple",
+    "setup_spotify",
+    "upload_pdf",
+    "simple.pdf_extractor",
+    "simple.spotify_auth",
+    "simple.spotify_search",
+    "simple.spotify_playlist",
+    "simple.results_writer",
+]
+
+# Dependencies that must only be loaded when the stage that needs them runs
+HEAVY_MODULES = ["spotipy", "PyPDF2", "dotenv", "requests", "urllib3", "webbrowser"]
+
+# Default cumulative import time budget per module, in milliseconds
+DEFAULT_BUDGET_MS = 50.0
+
+def measure_import(module: str) -> Tuple[float, List[str]]:
+    """
+    Import a module in a fresh interpreter and report what it cost.
+
+    Args:
+        module: Dotted name of the module to import
+
+    Returns:
+        Tuple of (cumulative import time in ms, list of top-level packages imported)
+    """
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_dir,
+        capture_output=True,
+        text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr}")
+
+    cumulative_us = None
+    imported = []
+    for line in proc.stderr.splitlines():
+        # Lines look like "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].strip()
+        imported.append(name.split(".")[0])
+        if name == module:
+            cumulative_us = int(parts[1].strip())
+
+    if cumulative_us is None:
+        raise RuntimeError(f"No -X importtime entry found for {module}")
+
+    return cumulative_us / 1000, imported
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+
+    print("Import Time Check")
+    print("=================")
+    print(f"Budget: {budget_ms:.1f} ms per module\n")
+
+    failures = []
+    for module in MODULES:
+        try:
+            elapsed_ms, imported = measure_import(module)
+        except RuntimeError as e:
+            failures.append(str(e))
+            print(f"{module:<28} FAILED")
+            continue
+
+        heavy = sorted(set(imported).intersection(HEAVY_MODULES))
+        status = "ok"
+        if elapsed_ms > budget_ms:
+            status = "OVER BUDGET"
+            failures.append(f"{module} took {elapsed_ms:.1f} ms to import (budget {budget_ms:.1f} ms)")
+        if heavy:
+            status = "HEAVY IMPORTS"
+            failures.append(f"{module} imports {', '.join(heavy)} at startup")
+
+        print(f"{module:<28} {elapsed_ms:8.1f} ms  {status}")
+
+    if failures:
+        print("\nImport time check failed:")
+        for failure in failures:
+            print(f"- {failure}")
+        sys.exit(1)
+
+    print("\nAll modules are within the import time budget.")
+
+if __name__ == "__main__":
+    main()
@@ -9,20 +9,25 @@ The script also handles exceptions and provides feedback to the user.
 
 import os
 import sys
+import time
 import traceback
-from dotenv import load_dotenv
 
-# Import modules from the simple package
-from simple.pdf_extractor import extract_songs_from_pdf
-from simple.spotify_auth import authenticate_spotify
-from simple.spotify_search import search_songs
-from simple.spotify_playlist import create_playlist
+# Modules from the simple package and their dependencies (spotipy, PyPDF2,
+# python-dotenv) are imported inside main() by the stage that needs them, so
+# startup stays fast. Run check_import_time.py to make sure it stays that way.
 
-# Load environment variables
-load_dotenv()
+USAGE = """Usage: python main_simple.py
+
+Extract songs from the PDF set in PDF_FILE_PATH (or entered at the prompt),
+search for them on Spotify and create a playlist with the songs found.
+Credentials are read from the .env file in the current directory."""
 
 def main():
     """Main function to run the script."""
+    if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help"):
+        print(USAGE)
+        return
+    
     print("=== Spotify Playlist Creator ===")
     print("You can press Ctrl+C during song search to stop and create a playlist with songs found so far.")
     
@@ -32,6 +37,10 @@ def main():
         print("Please create a .env file with your Spotify API credentials")
         sys.exit(1)
     
+    # Load environment variables
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     # Get PDF file path from .env or user input
     pdf_path = os.getenv("PDF_FILE_PATH")
     if not pdf_path or not os.path.exists(pdf_path):
@@ -39,6 +48,7 @@ def main():
     
     try:
         # Extract songs from PDF
+        from simple.pdf_extractor import extract_songs_from_pdf
         songs = extract_songs_from_pdf(pdf_path)
         
         if not songs:
@@ -66,14 +76,22 @@ def main():
             print(f"{i}. {song['song_title']} by {song['artist']}")
         
         # Authenticate with Spotify
+        from simple.spotify_auth import authenticate_spotify
         sp = authenticate_spotify()
         
-        # Search for songs on Spotify
-        search_results = search_songs(sp, songs)
+        # Search for songs on Spotify, streaming each result to disk as it resolves
+        from simple.spotify_search import search_songs
+        from simple.results_writer import ResultsWriter
+        results_path = os.getenv("RESULTS_FILE_PATH") or f"search_results_{time.strftime('%Y%m%d_%H%M%S')}.jsonl"
+        results_csv_path = os.getenv("RESULTS_CSV_PATH")
+        with ResultsWriter(results_path, results_csv_path) as writer:
+            search_results = search_songs(sp, songs, writer)
+        print(f"Saved {writer.written} search results to {results_path}")
+        if results_csv_path:
+            print(f"Saved CSV export to {results_csv_path}")
         
         # Check if we have any found songs
-        found_count = sum(1 for r in search_results if r.get("found", False))
-        if found_count == 0:
+        if not search_results["track_ids"]:
             print("\nNo songs were found on Spotify. Cannot create a playlist.")
             print("Please try again with different songs or check the song information.")
             return
@@ -82,6 +100,7 @@ def main():
         playlist_name = input("\nEnter a name for your playlist: ")
         description = input("Enter a description for your playlist (optional): ")
         
+        from simple.spotify_playlist import create_playlist
         result = create_playlist(sp, search_results, playlist_name, description)
         
         if result["status"] == "success":
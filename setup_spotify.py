@@ -5,8 +5,6 @@ This script helps users set up their Spotify API credentials.
 """
 
 import os
-import webbrowser
-from dotenv import load_dotenv, set_key
 
 def main():
     print("Spotify Setup Helper for Spotify Playlist Creator")
@@ -16,6 +14,7 @@ def main():
     env_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
     
     if os.path.exists(env_file):
+        from dotenv import load_dotenv
         load_dotenv(env_file)
     
     # Check if Spotify credentials are already set
@@ -32,6 +31,7 @@ def main():
     
     # Open Spotify Developer Dashboard
     print("\nOpening Spotify Developer Dashboard in your browser...")
+    import webbrowser
     webbrowser.open("https://developer.spotify.com/dashboard/")
     
     print("\nFollow these steps:")
@@ -56,6 +56,7 @@ def main():
     # Save to .env file
     if os.path.exists(env_file):
         # Update existing .env file
+        from dotenv import set_key
         set_key(env_file, "SPOTIFY_CLIENT_ID", client_id)
         set_key(env_file, "SPOTIFY_CLIENT_SECRET", client_secret)
         set_key(env_file, "SPOTIFY_REDIRECT_URI", "http://127.0.0.1:8888/callback")
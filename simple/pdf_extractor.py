@@ -5,7 +5,6 @@ This module handles extracting song information from PDF files.
 """
 
 import os
-import PyPDF2
 from typing import List, Dict, Any
 
 def extract_songs_from_pdf(pdf_path: str) -> List[Dict[str, str]]:
@@ -24,6 +23,8 @@ def extract_songs_from_pdf(pdf_path: str) -> List[Dict[str, str]]:
         print(f"Error: PDF file not found at {pdf_path}")
         return []
     
+    import PyPDF2
+    
     try:
         # Open the PDF file
         with open(pdf_path, 'rb') as file:
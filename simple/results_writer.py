@@ -0,0 +1,114 @@
+"""
+Results Writer Module
+
+This module handles streaming search results to disk as they are resolved.
+"""
+
+import csv
+import json
+import os
+from typing import Dict, Any, Optional
+
+# Columns written to the optional CSV export, one row per searched song
+CSV_COLUMNS = [
+    "song_title",
+    "artist",
+    "found",
+    "track_id",
+    "track_name",
+    "artist_name",
+    "album_name",
+    "strategy",
+    "score",
+    "latency_ms",
+    "message",
+]
+
+class ResultsWriter:
+    """
+    Write search results incrementally to a JSONL file and optionally a CSV file.
+
+    Each result is written and flushed as soon as it is passed to write(), so
+    the writer holds no results in memory and an interrupted run still leaves a
+    usable file behind.
+    """
+
+    def __init__(self, jsonl_path: str, csv_path: Optional[str] = None):
+        """
+        Args:
+            jsonl_path: Path of the JSONL file to write every result to
+            csv_path: Optional path of a CSV file with one flat row per result
+        """
+        self.jsonl_path = jsonl_path
+        self.csv_path = csv_path
+        self.written = 0
+        self._jsonl_file = None
+        self._csv_file = None
+        self._csv_writer = None
+
+    def open(self) -> "ResultsWriter":
+        """Open the output files, creating parent directories if needed."""
+        self._jsonl_file = _open_for_writing(self.jsonl_path)
+        if self.csv_path:
+            self._csv_file = _open_for_writing(self.csv_path, newline="")
+            self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=CSV_COLUMNS)
+            self._csv_writer.writeheader()
+        return self
+
+    def write(self, result: Dict[str, Any]) -> None:
+        """
+        Write a single search result.
+
+        Args:
+            result: A result dictionary as produced by search_songs()
+        """
+        if self._jsonl_file is None:
+            raise RuntimeError("ResultsWriter is not open")
+        
+        self._jsonl_file.write(json.dumps(result, ensure_ascii=False) + "\n")
+        self._jsonl_file.flush()
+
+        if self._csv_writer:
+            self._csv_writer.writerow(_flatten_result(result))
+            self._csv_file.flush()
+
+        self.written += 1
+
+    def close(self) -> None:
+        """Close the output files."""
+        for f in (self._jsonl_file, self._csv_file):
+            if f:
+                f.close()
+        self._jsonl_file = None
+        self._csv_file = None
+        self._csv_writer = None
+
+    def __enter__(self) -> "ResultsWriter":
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, tb) -> None:
+        self.close()
+
+def _open_for_writing(path: str, newline: Optional[str] = None):
+    """Open a UTF-8 text file for writing, creating its directory first."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return open(path, "w", encoding="utf-8", newline=newline)
+
+def _flatten_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a search result into a CSV row."""
+    query = result.get("original_query", {})
+    return {
+        "song_title": query.get("song_title", ""),
+        "artist": query.get("artist", ""),
+        "found": result.get("found", False),
+        "track_id": result.get("track_id", ""),
+        "track_name": result.get("track_name", ""),
+        "artist_name": result.get("artist_name", ""),
+        "album_name": result.get("album_name", ""),
+        "strategy": result.get("strategy", ""),
+        "score": "" if result.get("score") is None else result["score"],
+        "latency_ms": result.get("latency_ms", ""),
+        "message": result.get("message", ""),
+    }
@@ -6,10 +6,12 @@ This module handles authentication with the Spotify API.
 
 import os
 import sys
-import spotipy
-from spotipy.oauth2 import SpotifyOAuth
+from typing import TYPE_CHECKING
 
-def authenticate_spotify() -> spotipy.Spotify:
+if TYPE_CHECKING:
+    import spotipy
+
+def authenticate_spotify() -> "spotipy.Spotify":
     """
     Authenticate with Spotify API.
     
@@ -27,6 +29,10 @@ def authenticate_spotify() -> spotipy.Spotify:
         print("Please set them in your .env file")
         sys.exit(1)
     
+    # spotipy pulls in requests and urllib3, so only load it once we need it
+    import spotipy
+    from spotipy.oauth2 import SpotifyOAuth
+    
     try:
         # Set up authentication
         auth_manager = SpotifyOAuth(
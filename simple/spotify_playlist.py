@@ -4,17 +4,18 @@ Spotify Playlist Module
 This module handles creating playlists and adding tracks to them on Spotify.
 """
 
-import webbrowser
-import spotipy
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TYPE_CHECKING
 
-def create_playlist(sp: spotipy.Spotify, search_results: List[Dict[str, Any]], playlist_name: str, description: str = "") -> Dict[str, Any]:
+if TYPE_CHECKING:
+    import spotipy
+
+def create_playlist(sp: "spotipy.Spotify", search_results: Dict[str, List[Any]], playlist_name: str, description: str = "") -> Dict[str, Any]:
     """
     Create a Spotify playlist with the found tracks.
     
     Args:
         sp: Authenticated Spotify client
-        search_results: List of search results from search_songs()
+        search_results: Dictionary with track_ids and not_found from search_songs()
         playlist_name: Name of the playlist to create
         description: Description of the playlist
         
@@ -35,11 +36,9 @@ def create_playlist(sp: spotipy.Spotify, search_results: List[Dict[str, Any]], p
             description=description
         )
         
-        # Get track IDs for found songs
-        track_ids = [result["track_id"] for result in search_results if result.get("found", False)]
-        
-        # Add tracks to the playlist (in batches of 100 as per Spotify API limits)
-        not_found = [result["original_query"] for result in search_results if not result.get("found", False)]
+        # Get track IDs for found songs and the queries that were not found
+        track_ids = search_results["track_ids"]
+        not_found = search_results["not_found"]
         
         if track_ids:
             # Add tracks in batches of 100
@@ -56,6 +55,7 @@ def create_playlist(sp: spotipy.Spotify, search_results: List[Dict[str, Any]], p
         print(f"URL: {playlist['external_urls']['spotify']}")
         
         # Open the playlist in the browser
+        import webbrowser
         webbrowser.open(playlist['external_urls']['spotify'])
         
         return {
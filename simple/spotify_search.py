@@ -4,24 +4,62 @@ Spotify Search Module
 This module handles searching for songs on Spotify.
 """
 
-import spotipy
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 
-def search_songs(sp: spotipy.Spotify, songs: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+if TYPE_CHECKING:
+    import spotipy
+    from simple.results_writer import ResultsWriter
+
+def _match_score(title: str, artist: str, item: Dict[str, Any]) -> float:
+    """
+    Score how well a Spotify track matches a song by counting matching words.
+    
+    Args:
+        title: Song title that was searched for
+        artist: Artist that was searched for (may be empty)
+        item: Track item from a Spotify search result
+        
+    Returns:
+        Fraction of title words found in the track name, plus the fraction of
+        artist words found in each of the track's artists
+    """
+    title_words = set(title.lower().split())
+    result_words = set(item["name"].lower().split())
+    common_words = title_words.intersection(result_words)
+    score = len(common_words) / max(len(title_words), 1)
+    
+    # If artist is specified, boost score for matching artists
+    if artist:
+        artist_words = set(artist.lower().split())
+        for spotify_artist in item["artists"]:
+            result_artist_words = set(spotify_artist["name"].lower().split())
+            common_artist_words = artist_words.intersection(result_artist_words)
+            score += len(common_artist_words) / max(len(artist_words), 1)
+    
+    return score
+
+def search_songs(sp: "spotipy.Spotify", songs: List[Dict[str, str]], writer: Optional["ResultsWriter"] = None) -> Dict[str, List[Any]]:
     """
     Search for songs on Spotify.
     
+    Only the track IDs and the unmatched queries are kept in memory. Pass a
+    writer to keep the full result for every song, including the matched track,
+    search strategy, match score and latency.
+    
     Args:
         sp: Authenticated Spotify client
         songs: List of dictionaries with song_title and artist
+        writer: Optional open ResultsWriter that each result is streamed to as it resolves
         
     Returns:
-        List of search results with track information
+        Dictionary with the found track_ids and the not_found original queries
     """
     print("Searching for songs on Spotify...")
     print("Press Ctrl+C at any time to stop searching and create a playlist with songs found so far.")
     
-    results = []
+    track_ids = []
+    not_found = []
     
     try:
         for i, song in enumerate(songs):
@@ -32,10 +70,13 @@ def search_songs(sp: spotipy.Spotify, songs: List[Dict[str, str]]) -> List[Dict[
                 continue
             
             print(f"\nSearching {i+1}/{len(songs)}: {song_title} by {artist}")
+            start_time = time.perf_counter()
             
             try:
                 # Try multiple search strategies
                 track = None
+                strategy = None
+                score = None
                 
                 # Strategy 1: Search with track and artist
                 if artist:
@@ -43,6 +84,8 @@ def search_songs(sp: spotipy.Spotify, songs: List[Dict[str, str]]) -> List[Dict[
                     search_result = sp.search(query, type="track", limit=5)
                     if search_result and search_result["tracks"]["items"]:
                         track = search_result["tracks"]["items"][0]
+                        strategy = "track_artist"
+                        score = round(_match_score(song_title, artist, track), 3)
                 
                 # Strategy 2: Search with just the track name if strategy 1 failed
                 if not track:
@@ -50,6 +93,8 @@ def search_songs(sp: spotipy.Spotify, songs: List[Dict[str, str]]) -> List[Dict[
                     search_result = sp.search(query, type="track", limit=5)
                     if search_result and search_result["tracks"]["items"]:
                         track = search_result["tracks"]["items"][0]
+                        strategy = "track_only"
+                        score = round(_match_score(song_title, artist, track), 3)
                 
                 # Strategy 3: Try a more general search without field specifiers
                 if not track:
@@ -73,27 +118,15 @@ def search_songs(sp: spotipy.Spotify, songs: List[Dict[str, str]]) -> List[Dict[
                         highest_score = 0
                         
                         for item in search_result["tracks"]["items"]:
-                            # Simple scoring system - count matching words
-                            title_words = set(clean_title.lower().split())
-                            result_words = set(item["name"].lower().split())
-                            common_words = title_words.intersection(result_words)
-                            score = len(common_words) / max(len(title_words), 1)
-                            
-                            # If artist is specified, boost score for matching artists
-                            if artist:
-                                artist_words = set(artist.lower().split())
-                                for spotify_artist in item["artists"]:
-                                    result_artist_words = set(spotify_artist["name"].lower().split())
-                                    common_artist_words = artist_words.intersection(result_artist_words)
-                                    artist_score = len(common_artist_words) / max(len(artist_words), 1)
-                                    score += artist_score
-                            
-                            if score > highest_score:
-                                highest_score = score
+                            item_score = _match_score(clean_title, artist, item)
+                            if item_score > highest_score:
+                                highest_score = item_score
                                 best_match = item
                         
                         if best_match and highest_score > 0.3:  # Threshold for accepting a match
                             track = best_match
+                            strategy = "simplified"
+                            score = round(highest_score, 3)
                 
                 # Check if we found a match with any strategy
                 if track:
@@ -109,7 +142,10 @@ def search_songs(sp: spotipy.Spotify, songs: List[Dict[str, str]]) -> List[Dict[
                         "artist_name": track["artists"][0]["name"],
                         "album_name": track["album"]["name"],
                         "preview_url": track["preview_url"],
-                        "external_url": track["external_urls"]["spotify"]
+                        "external_url": track["external_urls"]["spotify"],
+                        "strategy": strategy,
+                        "score": score,
+                        "latency_ms": round((time.perf_counter() - start_time) * 1000, 1)
                     }
                     print(f"Found match: {track['name']} by {track['artists'][0]['name']}")
                 else:
@@ -120,33 +156,43 @@ def search_songs(sp: spotipy.Spotify, songs: List[Dict[str, str]]) -> List[Dict[
                             "artist": artist
                         },
                         "found": False,
-                        "message": "No matching track found on Spotify"
+                        "message": "No matching track found on Spotify",
+                        "latency_ms": round((time.perf_counter() - start_time) * 1000, 1)
                     }
                     print(f"No match found for: {song_title}")
                 
-                results.append(result)
-                
             except Exception as e:
                 print(f"Error searching for {song_title}: {str(e)}")
-                results.append({
+                result = {
                     "original_query": {
                         "song_title": song_title,
                         "artist": artist
                     },
                     "found": False,
-                    "message": f"Error: {str(e)}"
-                })
+                    "message": f"Error: {str(e)}",
+                    "latency_ms": round((time.perf_counter() - start_time) * 1000, 1)
+                }
+            
+            if result["found"]:
+                track_ids.append(result["track_id"])
+            else:
+                not_found.append(result["original_query"])
+            
+            # Stream the result to disk as soon as it resolves
+            if writer:
+                writer.write(result)
                 
             # After each song, print a progress update
-            found_so_far = sum(1 for r in results if r.get("found", False))
-            print(f"Progress: Found {found_so_far} out of {i+1} songs processed ({len(songs)} total)")
+            print(f"Progress: Found {len(track_ids)} out of {i+1} songs processed ({len(songs)} total)")
             
     except KeyboardInterrupt:
         print("\n\nSearch interrupted by user!")
         print("Proceeding with playlist creation using songs found so far...")
     
     # Print summary
-    found_count = sum(1 for r in results if r.get("found", False))
-    print(f"\nSearch complete or interrupted. Found {found_count} out of {len(results)} songs on Spotify")
+    print(f"\nSearch complete or interrupted. Found {len(track_ids)} out of {len(track_ids) + len(not_found)} songs on Spotify")
     
-    return results
\ No newline at end of file
+    return {
+        "track_ids": track_ids,
+        "not_found": not_found
+    }
\ No newline at end of file
@@ -7,7 +7,6 @@ This script helps users upload their PDF file to the data directory.
 import os
 import shutil
 import sys
-from dotenv import load_dotenv, set_key
 
 def main():
     print("PDF Upload Helper for Spotify Playlist Creator")
@@ -47,6 +46,7 @@ def main():
         
         if os.path.exists(env_file):
             # Load existing .env file
+            from dotenv import load_dotenv, set_key
             load_dotenv(env_file)
             
             # Update the PDF_FILE_PATH variable